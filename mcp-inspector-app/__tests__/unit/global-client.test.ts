@@ -0,0 +1,236 @@
+/**
+ * Unit tests for global-client.ts
+ * Tests connection sharing and tool list/result caching (MCPClient is mocked)
+ */
+
+import { MCPGlobalClient } from '../../lib/mcp/global-client';
+import { MCPClient } from '../../lib/mcp/client';
+import type { MCPServerConfig, MCPToolResult } from '@/types/mcp';
+
+jest.mock('../../lib/mcp/client');
+
+const MockMCPClient = MCPClient as jest.MockedClass<typeof MCPClient>;
+
+const docsServer: MCPServerConfig = {
+  id: 'aws-docs',
+  name: 'AWS Docs',
+  command: 'uvx',
+  args: ['awslabs.aws-documentation-mcp-server@latest'],
+  pureTools: ['search_documentation'],
+};
+
+function textResult(text: string, isError = false): MCPToolResult {
+  return { content: [{ type: 'text', text }], isError };
+}
+
+/**
+ * Connect a client to the docs server and discover its tools.
+ * Returns the mocked per-server MCPClient's callTool.
+ */
+async function connectDocsServer(client: MCPGlobalClient) {
+  await client.connect(docsServer);
+
+  const serverClient = MockMCPClient.mock.instances[0] as jest.Mocked<MCPClient>;
+  serverClient.listTools.mockResolvedValue([
+    { name: 'search_documentation', description: 'Search docs', inputSchema: {} },
+    { name: 'submit_feedback', description: 'Send feedback', inputSchema: {} },
+  ]);
+  serverClient.callTool.mockImplementation(async (toolName, args) =>
+    textResult(`${toolName}:${JSON.stringify(args)}`)
+  );
+  await client.listTools();
+
+  return serverClient.callTool;
+}
+
+describe('MCPGlobalClient tool result cache', () => {
+  let client: MCPGlobalClient;
+
+  beforeEach(() => {
+    MockMCPClient.mockClear();
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    client = new MCPGlobalClient();
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+    jest.useRealTimers();
+  });
+
+  it('should cache results of pure tools', async () => {
+    await connectDocsServer(client);
+
+    const result = await client.callTool('search_documentation', { search_phrase: 'S3' });
+
+    expect(client.getCachedToolResult('search_documentation', { search_phrase: 'S3' })).toBe(result);
+  });
+
+  it('should match cached results regardless of argument key order', async () => {
+    await connectDocsServer(client);
+
+    await client.callTool('search_documentation', { search_phrase: 'S3', limit: 5 });
+
+    expect(
+      client.getCachedToolResult('search_documentation', { limit: 5, search_phrase: 'S3' })
+    ).toBeDefined();
+  });
+
+  it('should not cache tools that are not marked pure', async () => {
+    await connectDocsServer(client);
+
+    await client.callTool('submit_feedback', { text: 'great' });
+
+    expect(client.getCachedToolResult('submit_feedback', { text: 'great' })).toBeUndefined();
+  });
+
+  it('should not cache error results', async () => {
+    const serverCallTool = await connectDocsServer(client);
+    serverCallTool.mockResolvedValueOnce(textResult('boom', true));
+
+    await client.callTool('search_documentation', { search_phrase: 'S3' });
+
+    expect(client.getCachedToolResult('search_documentation', { search_phrase: 'S3' })).toBeUndefined();
+  });
+
+  it('should always call the server from callTool', async () => {
+    const serverCallTool = await connectDocsServer(client);
+
+    await client.callTool('search_documentation', { search_phrase: 'S3' });
+    await client.callTool('search_documentation', { search_phrase: 'S3' });
+
+    expect(serverCallTool).toHaveBeenCalledTimes(2);
+  });
+
+  it('should expire cached results after the TTL', async () => {
+    jest.useFakeTimers();
+    await connectDocsServer(client);
+
+    await client.callTool('search_documentation', { search_phrase: 'S3' });
+    jest.advanceTimersByTime(5 * 60 * 1000 + 1);
+
+    expect(client.getCachedToolResult('search_documentation', { search_phrase: 'S3' })).toBeUndefined();
+    expect(client.getSessionInfo().cachedToolResults).toBe(0);
+  });
+
+  it('should evict the least recently used result when full', async () => {
+    await connectDocsServer(client);
+
+    for (let i = 0; i < 1024; i++) {
+      await client.callTool('search_documentation', { search_phrase: `q${i}` });
+    }
+
+    // Touch the oldest entry so q1 becomes least recently used
+    client.getCachedToolResult('search_documentation', { search_phrase: 'q0' });
+    await client.callTool('search_documentation', { search_phrase: 'q1024' });
+
+    expect(client.getSessionInfo().cachedToolResults).toBe(1024);
+    expect(client.getCachedToolResult('search_documentation', { search_phrase: 'q0' })).toBeDefined();
+    expect(client.getCachedToolResult('search_documentation', { search_phrase: 'q1' })).toBeUndefined();
+  });
+
+  it('should clear cached results when the tool list changes', async () => {
+    await connectDocsServer(client);
+    await client.callTool('search_documentation', { search_phrase: 'S3' });
+
+    const serverClient = MockMCPClient.mock.instances[0] as jest.Mocked<MCPClient>;
+    serverClient.setToolListChangedHandler.mock.calls[0][0]!();
+
+    expect(client.getCachedToolResult('search_documentation', { search_phrase: 'S3' })).toBeUndefined();
+  });
+
+  it('should clear cached results on disconnect', async () => {
+    await connectDocsServer(client);
+    await client.callTool('search_documentation', { search_phrase: 'S3' });
+
+    await client.disconnect();
+
+    expect(client.getSessionInfo().cachedToolResults).toBe(0);
+    expect(client.getCachedToolResult('search_documentation', { search_phrase: 'S3' })).toBeUndefined();
+  });
+});
+
+describe('MCPGlobalClient tool list cache', () => {
+  let client: MCPGlobalClient;
+
+  beforeEach(() => {
+    MockMCPClient.mockClear();
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    client = new MCPGlobalClient();
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should reuse the tool list until the server reports a change', async () => {
+    await connectDocsServer(client);
+    const serverClient = MockMCPClient.mock.instances[0] as jest.Mocked<MCPClient>;
+
+    await client.listTools();
+    expect(serverClient.listTools).toHaveBeenCalledTimes(1);
+    expect(client.hasCachedToolList()).toBe(true);
+
+    const onToolListChanged = serverClient.setToolListChangedHandler.mock.calls[0][0]!;
+    onToolListChanged();
+
+    expect(client.hasCachedToolList()).toBe(false);
+    await client.listTools();
+    expect(serverClient.listTools).toHaveBeenCalledTimes(2);
+  });
+
+  it('should stop routing tools that disappear after a change', async () => {
+    await connectDocsServer(client);
+    const serverClient = MockMCPClient.mock.instances[0] as jest.Mocked<MCPClient>;
+
+    serverClient.listTools.mockResolvedValue([
+      { name: 'search_documentation', description: 'Search docs', inputSchema: {} },
+    ]);
+    serverClient.setToolListChangedHandler.mock.calls[0][0]!();
+
+    const tools = await client.listTools();
+
+    expect(tools.map(t => t.name)).toEqual(['search_documentation']);
+    expect(client.getSessionInfo().totalTools).toBe(1);
+    await expect(client.callTool('submit_feedback', { text: 'great' })).rejects.toThrow(
+      'Tool "submit_feedback" not found'
+    );
+  });
+
+  it('should not cache a listing that was invalidated while in flight', async () => {
+    await connectDocsServer(client);
+    const serverClient = MockMCPClient.mock.instances[0] as jest.Mocked<MCPClient>;
+    serverClient.setToolListChangedHandler.mock.calls[0][0]!();
+
+    let resolveListing: (tools: Awaited<ReturnType<MCPClient['listTools']>>) => void = () => {};
+    serverClient.listTools.mockReturnValueOnce(
+      new Promise(resolve => { resolveListing = resolve; })
+    );
+
+    const listing = client.listTools();
+    serverClient.setToolListChangedHandler.mock.calls[0][0]!();
+    resolveListing([{ name: 'search_documentation', description: 'Old', inputSchema: {} }]);
+    await listing;
+
+    expect(client.hasCachedToolList()).toBe(false);
+  });
+});
+
+describe('MCPGlobalClient connections', () => {
+  beforeEach(() => {
+    MockMCPClient.mockClear();
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should share one in-flight connection between concurrent connects', async () => {
+    const client = new MCPGlobalClient();
+
+    await Promise.all([client.connect(docsServer), client.connect(docsServer)]);
+
+    expect(MockMCPClient).toHaveBeenCalledTimes(1);
+    expect(client.getSessionInfo().connectedServers).toEqual(['aws-docs']);
+  });
+});
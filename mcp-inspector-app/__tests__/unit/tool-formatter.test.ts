@@ -0,0 +1,115 @@
+/**
+ * Unit tests for tool-formatter.ts
+ * Tests MCP ↔ Claude schema conversion and result formatting
+ */
+
+import {
+  convertMCPToolsToClaudeFormat,
+  formatToolResultForClaude,
+  splitResponseContent,
+} from '../../lib/llm/tool-formatter';
+import { canonicalJSON } from '../../lib/canonical-json';
+
+const searchTool = {
+  name: 'search_documentation',
+  description: 'Search AWS documentation',
+  inputSchema: {
+    type: 'object' as const,
+    properties: { search_phrase: { type: 'string' } },
+    required: ['search_phrase'],
+  },
+};
+
+describe('Tool Formatter', () => {
+  describe('convertMCPToolsToClaudeFormat', () => {
+    it('should rename inputSchema to input_schema', () => {
+      const [tool] = convertMCPToolsToClaudeFormat([searchTool]);
+
+      expect(tool).toEqual({
+        name: 'search_documentation',
+        description: 'Search AWS documentation',
+        input_schema: searchTool.inputSchema,
+      });
+    });
+
+    it('should keep only the first tool when names collide', () => {
+      const tools = convertMCPToolsToClaudeFormat([
+        searchTool,
+        { ...searchTool, description: 'Duplicate from another server' },
+      ]);
+
+      expect(tools).toHaveLength(1);
+      expect(tools[0].description).toBe('Search AWS documentation');
+    });
+  });
+
+  describe('splitResponseContent', () => {
+    it('should separate tool calls from text blocks', () => {
+      const { toolCalls, textResponse } = splitResponseContent([
+        { type: 'text', text: 'Let me search.' },
+        { type: 'tool_use', id: 'toolu_1', name: 'search_documentation', input: { search_phrase: 'S3' } },
+        { type: 'text', text: 'One moment.' },
+      ]);
+
+      expect(toolCalls).toEqual([
+        { type: 'tool_use', id: 'toolu_1', name: 'search_documentation', input: { search_phrase: 'S3' } },
+      ]);
+      expect(textResponse).toBe('Let me search.\nOne moment.');
+    });
+
+    it('should return empty results for empty content', () => {
+      expect(splitResponseContent([])).toEqual({ toolCalls: [], textResponse: '' });
+    });
+  });
+
+  describe('formatToolResultForClaude', () => {
+    it('should join text content blocks', () => {
+      const result = formatToolResultForClaude('toolu_1', {
+        content: [
+          { type: 'text', text: 'first' },
+          { type: 'image', data: 'abc', mimeType: 'image/png' },
+          { type: 'text', text: 'second' },
+        ],
+      });
+
+      expect(result).toEqual({
+        type: 'tool_result',
+        tool_use_id: 'toolu_1',
+        content: 'first\nsecond',
+        is_error: false,
+      });
+    });
+
+    it('should fall back to a placeholder when there is no text content', () => {
+      const result = formatToolResultForClaude('toolu_3', {
+        content: [{ type: 'image', data: 'abc', mimeType: 'image/png' }],
+      });
+
+      expect(result.content).toBe('No content returned');
+    });
+
+    it('should stringify results without a content array', () => {
+      const result = formatToolResultForClaude('toolu_4', { value: 42 });
+
+      expect(result.content).toBe('{"value":42}');
+    });
+
+    it('should propagate isError', () => {
+      const result = formatToolResultForClaude('toolu_2', {
+        content: [{ type: 'text', text: 'boom' }],
+        isError: true,
+      });
+
+      expect(result.is_error).toBe(true);
+      expect(result.content).toBe('boom');
+    });
+  });
+});
+
+describe('canonicalJSON', () => {
+  it('should produce identical output regardless of key order', () => {
+    expect(canonicalJSON({ b: 1, a: { d: 2, c: [3, { f: 4, e: 5 }] } })).toBe(
+      canonicalJSON({ a: { c: [3, { e: 5, f: 4 }], d: 2 }, b: 1 })
+    );
+  });
+});
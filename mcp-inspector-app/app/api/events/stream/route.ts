@@ -23,10 +23,45 @@ import type { TimelineEvent } from '@/types/domain';
 export const runtime = 'nodejs';
 export const dynamic = 'force-dynamic';
 
+const encoder = new TextEncoder();
+
+/**
+ * Encoded SSE frames, keyed by event object.
+ *
+ * The global client hands the same event object to every subscriber and
+ * keeps it in the replay buffer, so each event is serialized and encoded
+ * once no matter how many clients receive it.
+ */
+const frameCache = new WeakMap<TimelineEvent, Uint8Array>();
+
+function toSSEFrame(event: TimelineEvent): Uint8Array {
+  let frame = frameCache.get(event);
+  if (!frame) {
+    frame = encoder.encode(`data: ${JSON.stringify(event)}\n\n`);
+    frameCache.set(event, frame);
+  }
+  return frame;
+}
+
+/**
+ * Concatenate encoded frames into a single chunk.
+ */
+function concatFrames(frames: Uint8Array[]): Uint8Array {
+  const totalLength = frames.reduce((sum, frame) => sum + frame.length, 0);
+  const chunk = new Uint8Array(totalLength);
+
+  let offset = 0;
+  for (const frame of frames) {
+    chunk.set(frame, offset);
+    offset += frame.length;
+  }
+
+  return chunk;
+}
+
 export async function GET(request: Request) {
   console.log('[SSE] New client connection');
 
-  const encoder = new TextEncoder();
   const mcpClient = getMCPClient();
 
   // Create readable stream for SSE
@@ -40,16 +75,15 @@ export async function GET(request: Request) {
       const bufferedEvents = mcpClient.getEventBuffer();
       console.log(`[SSE] Sending ${bufferedEvents.length} buffered events`);
 
-      for (const event of bufferedEvents) {
-        const message = `data: ${JSON.stringify(event)}\n\n`;
-        controller.enqueue(encoder.encode(message));
+      // Replay as one chunk (one write) rather than one write per event
+      if (bufferedEvents.length > 0) {
+        controller.enqueue(concatFrames(bufferedEvents.map(toSSEFrame)));
       }
 
       // Subscribe to new events
       const subscriptionId = mcpClient.subscribe((event: TimelineEvent) => {
         try {
-          const message = `data: ${JSON.stringify(event)}\n\n`;
-          controller.enqueue(encoder.encode(message));
+          controller.enqueue(toSSEFrame(event));
         } catch (error) {
           console.error('[SSE] Error sending event:', error);
         }
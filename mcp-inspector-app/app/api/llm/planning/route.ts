@@ -10,11 +10,13 @@
  */
 
 import { NextRequest, NextResponse } from 'next/server';
-import { createClaudeClient } from '@/lib/llm/claude-client';
+import { getClaudeClient } from '@/lib/llm/claude-client';
 import { getMCPClient } from '@/lib/mcp/global-client';
 import { executePlanningInference } from '@/lib/llm/inference';
 import type { ClaudeTool } from '@/lib/llm/tool-formatter';
 
+export const runtime = 'nodejs';
+
 export async function POST(request: NextRequest) {
   const startTime = Date.now();
   console.log('[/api/llm/planning] Planning inference request received');
@@ -46,7 +48,7 @@ export async function POST(request: NextRequest) {
     console.log(`[/api/llm/planning] Tools: ${tools.length}`);
 
     // Get clients
-    const claudeClient = createClaudeClient();
+    const claudeClient = getClaudeClient();
     const mcpClient = getMCPClient();
 
     // Execute planning inference with event recording
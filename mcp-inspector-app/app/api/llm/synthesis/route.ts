@@ -15,11 +15,13 @@
  */
 
 import { NextRequest, NextResponse } from 'next/server';
-import { createClaudeClient } from '@/lib/llm/claude-client';
+import { getClaudeClient } from '@/lib/llm/claude-client';
 import { getMCPClient } from '@/lib/mcp/global-client';
 import { executeSynthesisInference } from '@/lib/llm/inference';
 import type { ClaudeTool, ClaudeToolResult } from '@/lib/llm/tool-formatter';
 
+export const runtime = 'nodejs';
+
 export async function POST(request: NextRequest) {
   const startTime = Date.now();
   console.log('[/api/llm/synthesis] Synthesis inference request received');
@@ -68,7 +70,7 @@ export async function POST(request: NextRequest) {
     console.log(`[/api/llm/synthesis] Tools: ${tools.length}`);
 
     // Get clients
-    const claudeClient = createClaudeClient();
+    const claudeClient = getClaudeClient();
     const mcpClient = getMCPClient();
 
     // Execute synthesis inference with event recording
@@ -22,6 +22,8 @@
 import { getMCPClient } from '@/lib/mcp/global-client';
 import { mcpServerStorage, toMCPServerConfig } from '@/lib/storage/mcp-servers';
 
+export const runtime = 'nodejs';
+
 export async function POST(request: Request) {
   try {
     const mcpClient = getMCPClient();
@@ -17,6 +17,8 @@
 
 import { getMCPClient } from '@/lib/mcp/global-client';
 
+export const runtime = 'nodejs';
+
 export async function GET() {
   const mcpClient = getMCPClient();
   const sessionInfo = mcpClient.getSessionInfo();
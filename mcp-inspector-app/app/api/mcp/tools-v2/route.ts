@@ -15,6 +15,8 @@
 
 import { getMCPClient } from '@/lib/mcp/global-client';
 
+export const runtime = 'nodejs';
+
 export async function GET() {
   try {
     const mcpClient = getMCPClient();
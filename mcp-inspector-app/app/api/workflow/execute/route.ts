@@ -16,6 +16,8 @@
 import { NextRequest, NextResponse } from 'next/server';
 import { executeWorkflow, hasAPIKey } from '@/lib/orchestration';
 
+export const runtime = 'nodejs';
+
 /**
  * POST /api/workflow/execute
  *
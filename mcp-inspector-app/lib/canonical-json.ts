@@ -0,0 +1,23 @@
+/**
+ * Canonical JSON serialization utility
+ * Produces stable strings for use as cache keys
+ */
+
+/**
+ * Serialize a value to JSON with object keys sorted recursively.
+ *
+ * Two structurally equal values always produce the same string,
+ * regardless of the order their keys were inserted in.
+ */
+export function canonicalJSON(value: unknown): string {
+  return JSON.stringify(value, (_key, val) => {
+    if (val && typeof val === 'object' && !Array.isArray(val)) {
+      const sorted: Record<string, unknown> = {};
+      for (const key of Object.keys(val).sort()) {
+        sorted[key] = val[key];
+      }
+      return sorted;
+    }
+    return val;
+  });
+}
@@ -0,0 +1,23 @@
+/**
+ * Debug logging utility
+ * Verbose server-side logging gated behind the MCP_INSPECTOR_DEBUG env var
+ */
+
+/**
+ * Check whether verbose debug logging is enabled.
+ */
+export function isDebugEnabled(): boolean {
+  return process.env.MCP_INSPECTOR_DEBUG === 'true';
+}
+
+/**
+ * Log a debug message.
+ *
+ * The message is built lazily, so expensive formatting (e.g. serializing
+ * payloads) is skipped entirely when debug logging is disabled.
+ */
+export function debugLog(buildMessage: () => string): void {
+  if (isDebugEnabled()) {
+    console.log(buildMessage());
+  }
+}
@@ -15,10 +15,10 @@ import type {
   ClaudeToolResult
 } from './tool-formatter';
 import {
-  extractToolCalls,
-  extractTextResponse,
+  splitResponseContent,
   buildConversationWithResults
 } from './tool-formatter';
+import { debugLog } from '../debug-log';
 
 /**
  * Claude client configuration
@@ -27,6 +27,8 @@ export interface ClaudeClientConfig {
   apiKey: string;
   model?: string;
   maxTokens?: number;
+  timeoutMs?: number; // Per-request HTTP timeout
+  maxRetries?: number; // Retries on connection errors, 429s, and 5xx
 }
 
 /**
@@ -62,7 +64,11 @@ export class ClaudeClient {
   private maxTokens: number;
 
   constructor(config: ClaudeClientConfig) {
-    this.client = new Anthropic({ apiKey: config.apiKey });
+    this.client = new Anthropic({
+      apiKey: config.apiKey,
+      timeout: config.timeoutMs,
+      maxRetries: config.maxRetries,
+    });
     this.model = config.model || 'claude-sonnet-4-20250514';
     this.maxTokens = config.maxTokens || 1024;
   }
@@ -84,10 +90,10 @@ export class ClaudeClient {
     const startTime = Date.now();
 
     console.log('[ClaudeClient] Planning inference started');
-    console.log(`[ClaudeClient] User message: "${userMessage}"`);
+    debugLog(() => `[ClaudeClient] User message: "${userMessage}"`);
     console.log(`[ClaudeClient] Available tools: ${tools.length}`);
 
-    const response = await this.client.messages.create({
+    const response = await this.streamMessage({
       model: this.model,
       max_tokens: this.maxTokens,
       messages: [{ role: 'user', content: userMessage }],
@@ -101,25 +107,19 @@ export class ClaudeClient {
     console.log(`[ClaudeClient] Content blocks: ${response.content.length}`);
 
     // Extract tool calls and text
-    const toolCalls = extractToolCalls(response.content);
-    const textResponse = extractTextResponse(response.content);
+    const result = this.toInferenceResult(response);
+    const { toolCalls } = result;
 
     console.log(`[ClaudeClient] Tool calls: ${toolCalls.length}`);
     if (toolCalls.length > 0) {
-      toolCalls.forEach((tc, i) => {
-        console.log(`[ClaudeClient]   ${i + 1}. ${tc.name}`);
-      });
+      debugLog(() =>
+        toolCalls
+          .map((tc, i) => `[ClaudeClient]   ${i + 1}. ${tc.name} ${JSON.stringify(tc.input)}`)
+          .join('\n')
+      );
     }
 
-    return {
-      message: response,
-      toolCalls,
-      textResponse,
-      usage: {
-        inputTokens: response.usage.input_tokens,
-        outputTokens: response.usage.output_tokens,
-      }
-    };
+    return result;
   }
 
   /**
@@ -152,7 +152,7 @@ export class ClaudeClient {
       toolResults
     );
 
-    const response = await this.client.messages.create({
+    const response = await this.streamMessage({
       model: this.model,
       max_tokens: this.maxTokens,
       messages,
@@ -166,13 +166,21 @@ export class ClaudeClient {
     console.log(`[ClaudeClient] Content blocks: ${response.content.length}`);
 
     // Extract text (should not have tool_use blocks in synthesis)
-    const textResponse = extractTextResponse(response.content);
-    const toolCalls = extractToolCalls(response.content); // Should be empty
+    const result = this.toInferenceResult(response);
 
-    if (toolCalls.length > 0) {
+    if (result.toolCalls.length > 0) {
       console.warn(`[ClaudeClient] WARNING: Synthesis returned tool calls (unexpected)`);
     }
 
+    return result;
+  }
+
+  /**
+   * Build an inference result from a complete Claude message.
+   */
+  private toInferenceResult(response: Anthropic.Message): InferenceResult {
+    const { toolCalls, textResponse } = splitResponseContent(response.content);
+
     return {
       message: response,
       toolCalls,
@@ -184,6 +192,32 @@ export class ClaudeClient {
     };
   }
 
+  /**
+   * Send a message using the streaming API and resolve with the final message.
+   *
+   * Streaming keeps the connection active during long generations and lets
+   * us log time-to-first-token. The SDK assembles text and tool_use input
+   * (including partial JSON) into the same Message shape that
+   * messages.create() returns.
+   */
+  private async streamMessage(
+    params: Anthropic.MessageStreamParams
+  ): Promise<Anthropic.Message> {
+    const startTime = Date.now();
+    let firstTokenLogged = false;
+
+    const stream = this.client.messages.stream(params);
+
+    stream.on('streamEvent', (event) => {
+      if (!firstTokenLogged && event.type === 'content_block_delta') {
+        firstTokenLogged = true;
+        console.log(`[ClaudeClient] First token after ${Date.now() - startTime}ms`);
+      }
+    });
+
+    return await stream.finalMessage();
+  }
+
   /**
    * Get current model name
    */
@@ -215,5 +249,37 @@ export function createClaudeClient(apiKey?: string): ClaudeClient {
     apiKey: key,
     model: 'claude-sonnet-4-20250514',
     maxTokens: 1024,
+    timeoutMs: 60_000,
+    maxRetries: 2,
   });
 }
+
+/**
+ * Global Claude client for the environment API key.
+ *
+ * Uses globalThis to persist across API route invocations (same pattern as
+ * getMCPClient), so every workflow run shares one SDK instance and its
+ * pooled HTTPS connections instead of building a new client per query.
+ */
+declare global {
+  var claudeClient: ClaudeClient | undefined;
+}
+
+/**
+ * Get the shared Claude client.
+ *
+ * Only the client for ANTHROPIC_API_KEY is shared. A key supplied by the
+ * caller (e.g. in a request body) gets a fresh client that is not retained,
+ * so arbitrary keys never accumulate in process memory.
+ */
+export function getClaudeClient(apiKey?: string): ClaudeClient {
+  if (apiKey && apiKey !== process.env.ANTHROPIC_API_KEY) {
+    return createClaudeClient(apiKey);
+  }
+
+  if (!global.claudeClient) {
+    global.claudeClient = createClaudeClient();
+  }
+
+  return global.claudeClient;
+}
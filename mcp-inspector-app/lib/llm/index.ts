@@ -7,6 +7,7 @@
 export {
   ClaudeClient,
   createClaudeClient,
+  getClaudeClient,
   type ClaudeClientConfig,
   type InferenceContext,
   type InferenceResult
@@ -16,6 +17,7 @@ export {
   convertMCPToolsToClaudeFormat,
   extractToolCalls,
   extractTextResponse,
+  splitResponseContent,
   formatToolResultForClaude,
   buildConversationWithResults,
   type ClaudeTool,
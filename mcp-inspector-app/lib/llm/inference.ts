@@ -251,13 +251,37 @@ export async function executeSynthesisInference(
  * @param mcpClient - Global MCP client
  * @param toolName - Name of tool to execute
  * @param toolArgs - Arguments for tool
+ * @param requestId - JSON-RPC id for the recorded tools/call messages.
+ *   Give concurrent calls distinct ids so their request/response cards
+ *   can be told apart on the timeline.
  * @returns MCP tool result
  */
 export async function executeSingleTool(
   mcpClient: MCPGlobalClient,
   toolName: string,
-  toolArgs: Record<string, unknown>
+  toolArgs: Record<string, unknown>,
+  requestId: number = 3
 ): Promise<any> {
+  // Serve repeated calls to pure tools from cache (no MCP round trip)
+  const cachedResult = mcpClient.getCachedToolResult(toolName, toolArgs);
+  if (cachedResult) {
+    mcpClient.recordEvent({
+      eventType: 'console_log',
+      actor: 'host_app',
+      logLevel: 'info',
+      logMessage: `Using cached result for ${toolName}`,
+      badgeType: 'INTERNAL',
+      metadata: {
+        phase: 'execution',
+        messageType: 'tool_cache_hit',
+        toolName,
+        toolArguments: toolArgs
+      }
+    });
+
+    return cachedResult;
+  }
+
   // Record: Invoking tool (console log)
   mcpClient.recordEvent({
     eventType: 'console_log',
@@ -282,7 +306,7 @@ export async function executeSingleTool(
     lane: 'host_mcp',
     message: {
       jsonrpc: '2.0',
-      id: 3,
+      id: requestId,
       method: 'tools/call',
       params: {
         name: toolName,
@@ -291,7 +315,8 @@ export async function executeSingleTool(
     },
     metadata: {
       phase: 'execution',
-      messageType: 'tools_call_request'
+      messageType: 'tools_call_request',
+      toolName
     }
   });
 
@@ -304,12 +329,57 @@ export async function executeSingleTool(
     badgeType: 'SERVER',
     metadata: {
       phase: 'execution',
-      messageType: 'server_processing'
+      messageType: 'server_processing',
+      toolName
     }
   });
 
   // Execute tool via MCP client
-  const result = await mcpClient.callTool(toolName, toolArgs);
+  let result;
+  try {
+    result = await mcpClient.callTool(toolName, toolArgs);
+  } catch (error) {
+    const errorMessage = error instanceof Error ? error.message : String(error);
+
+    // Record: MCP tools/call error response (closes the request card)
+    mcpClient.recordEvent({
+      eventType: 'protocol_message',
+      actor: 'mcp_server',
+      direction: 'received',
+      lane: 'host_mcp',
+      message: {
+        jsonrpc: '2.0',
+        id: requestId,
+        error: {
+          code: -32603,
+          message: errorMessage
+        }
+      },
+      metadata: {
+        phase: 'execution',
+        messageType: 'tools_call_response',
+        processingTime: Date.now() - toolCallRequestTime,
+        toolName
+      }
+    });
+
+    // Record: Tool failure (console log)
+    mcpClient.recordEvent({
+      eventType: 'console_log',
+      actor: 'host_app',
+      logLevel: 'error',
+      logMessage: `Tool ${toolName} failed: ${errorMessage}`,
+      badgeType: 'INTERNAL',
+      metadata: {
+        phase: 'execution',
+        messageType: 'tool_error',
+        toolName,
+        error: errorMessage
+      }
+    });
+
+    throw error;
+  }
   const toolCallProcessingTime = Date.now() - toolCallRequestTime;
 
   // Record: MCP tools/call response (protocol message)
@@ -320,7 +390,7 @@ export async function executeSingleTool(
     lane: 'host_mcp',
     message: {
       jsonrpc: '2.0',
-      id: 3,
+      id: requestId,
       result: {
         content: result.content,
         isError: result.isError || false
@@ -329,7 +399,8 @@ export async function executeSingleTool(
     metadata: {
       phase: 'execution',
       messageType: 'tools_call_response',
-      processingTime: toolCallProcessingTime
+      processingTime: toolCallProcessingTime,
+      toolName
     }
   });
 
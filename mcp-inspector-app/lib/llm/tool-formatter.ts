@@ -44,15 +44,29 @@ export interface ClaudeToolResult {
  * The only change required is renaming inputSchema → input_schema.
  * Everything else (JSON Schema structure) remains identical.
  *
+ * Claude rejects duplicate tool names, so when several servers expose a
+ * tool with the same name only the first one is kept (matching the
+ * first-registered routing in MCPGlobalClient).
+ *
  * @param mcpTools - Tools from MCP server (tools/list response)
  * @returns Tools formatted for Claude API
  */
 export function convertMCPToolsToClaudeFormat(mcpTools: MCPTool[]): ClaudeTool[] {
-  return mcpTools.map(tool => ({
-    name: tool.name,
-    description: tool.description || '',
-    input_schema: tool.inputSchema, // Key transformation: inputSchema → input_schema
-  }));
+  const seenNames = new Set<string>();
+
+  return mcpTools
+    .filter(tool => {
+      if (seenNames.has(tool.name)) {
+        return false;
+      }
+      seenNames.add(tool.name);
+      return true;
+    })
+    .map(tool => ({
+      name: tool.name,
+      description: tool.description || '',
+      input_schema: tool.inputSchema, // Key transformation: inputSchema → input_schema
+    }));
 }
 
 /**
@@ -62,14 +76,7 @@ export function convertMCPToolsToClaudeFormat(mcpTools: MCPTool[]): ClaudeTool[]
  * @returns Tool use blocks only
  */
 export function extractToolCalls(content: any[]): ClaudeToolUse[] {
-  return content
-    .filter(block => block.type === 'tool_use')
-    .map(block => ({
-      type: 'tool_use' as const,
-      id: block.id,
-      name: block.name,
-      input: block.input,
-    }));
+  return splitResponseContent(content).toolCalls;
 }
 
 /**
@@ -79,10 +86,39 @@ export function extractToolCalls(content: any[]): ClaudeToolUse[] {
  * @returns Concatenated text from all text blocks
  */
 export function extractTextResponse(content: any[]): string {
-  return content
-    .filter(block => block.type === 'text')
-    .map(block => block.text)
-    .join('\n');
+  return splitResponseContent(content).textResponse;
+}
+
+/**
+ * Split Claude response content into tool calls and text in a single pass.
+ *
+ * extractToolCalls() and extractTextResponse() are thin wrappers around
+ * this; callers that need both should call it directly.
+ *
+ * @param content - Content blocks from Claude message response
+ * @returns Tool use blocks and concatenated text
+ */
+export function splitResponseContent(content: any[]): {
+  toolCalls: ClaudeToolUse[];
+  textResponse: string;
+} {
+  const toolCalls: ClaudeToolUse[] = [];
+  const textParts: string[] = [];
+
+  for (const block of content) {
+    if (block.type === 'tool_use') {
+      toolCalls.push({
+        type: 'tool_use',
+        id: block.id,
+        name: block.name,
+        input: block.input,
+      });
+    } else if (block.type === 'text') {
+      textParts.push(block.text);
+    }
+  }
+
+  return { toolCalls, textResponse: textParts.join('\n') };
 }
 
 /**
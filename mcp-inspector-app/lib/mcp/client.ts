@@ -13,6 +13,7 @@
 
 import { Client } from '@modelcontextprotocol/sdk/client/index.js';
 import { StdioClientTransport } from '@modelcontextprotocol/sdk/client/stdio.js';
+import { ToolListChangedNotificationSchema } from '@modelcontextprotocol/sdk/types.js';
 import type {
   MCPServerConfig,
   MCPTool,
@@ -24,6 +25,12 @@ import {
   recordMCPLog,
   getPhaseForMethod,
 } from './message-handlers';
+import { isDebugEnabled } from '../debug-log';
+
+/**
+ * Log sink for client activity (same signature as recordMCPLog).
+ */
+export type MCPLogger = typeof recordMCPLog;
 
 /**
  * MCP Client wrapper class.
@@ -34,6 +41,31 @@ export class MCPClient {
   private client: Client | null = null;
   private transport: StdioClientTransport | null = null;
   private connectionState: ConnectionState = { status: 'disconnected' };
+  private toolListChangedHandler: (() => void) | null = null;
+
+  /**
+   * @param logger - Where client activity is logged. Defaults to the browser
+   *   timeline store. Pass null when the caller records its own events
+   *   (e.g. MCPGlobalClient, whose workflow broadcasts via SSE) so logging
+   *   costs nothing and nothing accumulates in an unread server-side store.
+   */
+  constructor(private logger: MCPLogger | null = recordMCPLog) {}
+
+  /**
+   * Forward a log line to the configured logger, if any.
+   */
+  private log(...args: Parameters<MCPLogger>): void {
+    this.logger?.(...args);
+  }
+
+  /**
+   * Set a callback for notifications/tools/list_changed from the server.
+   *
+   * Call before connect(); the handler is registered when the client is created.
+   */
+  public setToolListChangedHandler(handler: (() => void) | null): void {
+    this.toolListChangedHandler = handler;
+  }
 
   /**
    * Get current connection status.
@@ -65,7 +97,7 @@ export class MCPClient {
       this.connectionState = { status: 'connecting' };
 
       // Record connection attempt
-      recordMCPLog(
+      this.log(
         `Connecting to MCP server: ${config.command} ${config.args.join(' ')}`,
         'host_app',
         'initialization',
@@ -90,8 +122,19 @@ export class MCPClient {
         }
       );
 
+      // Let the owner know when the server's tool list changes
+      this.client.setNotificationHandler(ToolListChangedNotificationSchema, async () => {
+        this.log(
+          'Server tool list changed',
+          'mcp_server',
+          'discovery',
+          'info'
+        );
+        this.toolListChangedHandler?.();
+      });
+
       // Record initialize request (SDK handles this internally)
-      recordMCPLog(
+      this.log(
         "Sending 'initialize' request",
         'host_app',
         'initialization',
@@ -102,7 +145,7 @@ export class MCPClient {
       await this.client.connect(this.transport);
 
       // Record completion
-      recordMCPLog(
+      this.log(
         'Handshake complete',
         'host_app',
         'initialization',
@@ -118,7 +161,7 @@ export class MCPClient {
       const errorMessage = error instanceof Error ? error.message : String(error);
 
       // Record error
-      recordMCPLog(
+      this.log(
         `Connection failed: ${errorMessage}`,
         'host_app',
         'initialization',
@@ -147,7 +190,7 @@ export class MCPClient {
 
     try {
       // Record request
-      recordMCPLog(
+      this.log(
         "Requesting 'tools/list'",
         'host_app',
         'discovery',
@@ -158,7 +201,7 @@ export class MCPClient {
       const response = await this.client.listTools();
 
       // Record response
-      recordMCPLog(
+      this.log(
         `Discovered ${response.tools.length} tool(s)`,
         'host_app',
         'discovery',
@@ -168,12 +211,14 @@ export class MCPClient {
       // Convert SDK tools to our MCPTool format
       const tools: MCPTool[] = response.tools.map((tool) => {
         // Log each discovered tool
-        recordMCPLog(
-          `Tool: ${tool.name} - ${tool.description}`,
-          'mcp_server',
-          'discovery',
-          'info'
-        );
+        if (this.logger && isDebugEnabled()) {
+          this.log(
+            `Tool: ${tool.name} - ${tool.description}`,
+            'mcp_server',
+            'discovery',
+            'debug'
+          );
+        }
 
         return {
           name: tool.name,
@@ -186,7 +231,7 @@ export class MCPClient {
     } catch (error) {
       const errorMessage = error instanceof Error ? error.message : String(error);
 
-      recordMCPLog(
+      this.log(
         `Tool discovery failed: ${errorMessage}`,
         'host_app',
         'discovery',
@@ -212,19 +257,22 @@ export class MCPClient {
 
     try {
       // Record tool invocation
-      recordMCPLog(
+      this.log(
         `Calling tool: ${toolName}`,
         'host_app',
         'execution',
         'info'
       );
 
-      recordMCPLog(
-        `Arguments: ${JSON.stringify(args)}`,
-        'host_app',
-        'execution',
-        'debug'
-      );
+      // Only serialize arguments when debug logging is enabled
+      if (this.logger && isDebugEnabled()) {
+        this.log(
+          `Arguments: ${JSON.stringify(args)}`,
+          'host_app',
+          'execution',
+          'debug'
+        );
+      }
 
       // Call tool
       const result = await this.client.callTool({
@@ -233,7 +281,7 @@ export class MCPClient {
       });
 
       // Record result received
-      recordMCPLog(
+      this.log(
         `Received result from ${toolName}`,
         'host_app',
         'execution',
@@ -273,7 +321,7 @@ export class MCPClient {
     } catch (error) {
       const errorMessage = error instanceof Error ? error.message : String(error);
 
-      recordMCPLog(
+      this.log(
         `Tool call failed: ${errorMessage}`,
         'host_app',
         'execution',
@@ -294,7 +342,7 @@ export class MCPClient {
       try {
         await this.client.close();
 
-        recordMCPLog(
+        this.log(
           'MCP client connection closed',
           'host_app',
           'initialization',
@@ -303,7 +351,7 @@ export class MCPClient {
       } catch (error) {
         const errorMessage = error instanceof Error ? error.message : String(error);
 
-        recordMCPLog(
+        this.log(
           `Disconnect error: ${errorMessage}`,
           'host_app',
           'initialization',
@@ -17,6 +17,7 @@
  */
 
 import { MCPClient } from './client';
+import { canonicalJSON } from '../canonical-json';
 import type {
   MCPServerConfig,
   MCPTool,
@@ -48,6 +49,21 @@ export class MCPGlobalClient {
   private clients: Map<string, MCPClient>; // serverId -> MCPClient
   private serverConfigs: Map<string, MCPServerConfig>; // serverId -> config
   private toolToServerMap: Map<string, string>; // toolName -> serverId
+  private pendingConnections: Map<string, Promise<void>>; // serverId -> in-flight connect
+
+  // Tool list cache: tools/list is answered once per set of connections and
+  // reused by later queries. Invalidated when servers connect or disconnect,
+  // or when a server sends notifications/tools/list_changed.
+  private toolListCache: MCPTool[] | null = null;
+  private toolListGeneration = 0; // Bumped on every invalidation
+
+  // Tool result cache: Repeated calls to side-effect-free tools with identical
+  // arguments skip the stdio round trip. Only tools marked pure are cached.
+  // Entries expire after a TTL since pure tools may still read live data.
+  private pureTools: Set<string>;
+  private toolResultCache: Map<string, { result: MCPToolResult; cachedAt: number }>; // toolName + canonical args
+  private maxToolResultCacheSize = 1024;
+  private toolResultTtlMs = 5 * 60 * 1000; // 5 minutes
   private subscribers: Map<string, EventCallback>; // subscriptionId -> callback
 
   // Event buffer: Stores last N events for late-joining SSE clients
@@ -63,6 +79,9 @@ export class MCPGlobalClient {
     this.clients = new Map();
     this.serverConfigs = new Map();
     this.toolToServerMap = new Map();
+    this.pendingConnections = new Map();
+    this.pureTools = new Set();
+    this.toolResultCache = new Map();
     this.subscribers = new Map();
     this.eventBuffer = [];
     this.currentSessionId = this.generateSessionId();
@@ -217,7 +236,8 @@ export class MCPGlobalClient {
    * Connect to a single MCP server.
    *
    * This method is idempotent - calling it multiple times for the same server
-   * won't create multiple connections.
+   * won't create multiple connections. Concurrent calls for the same server
+   * share the in-flight connection instead of spawning a second process.
    */
   public async connect(config: MCPServerConfig): Promise<void> {
     const serverId = config.id || 'default';
@@ -228,15 +248,46 @@ export class MCPGlobalClient {
       return;
     }
 
+    // Join a connection that is already in progress
+    const pending = this.pendingConnections.get(serverId);
+    if (pending) {
+      console.log(`[MCPGlobalClient] Connection to ${serverId} in progress, waiting`);
+      return await pending;
+    }
+
+    const connection = this.connectServer(serverId, config);
+    this.pendingConnections.set(serverId, connection);
+
+    try {
+      await connection;
+    } finally {
+      this.pendingConnections.delete(serverId);
+    }
+  }
+
+  /**
+   * Spawn and initialize a server, then register it.
+   */
+  private async connectServer(serverId: string, config: MCPServerConfig): Promise<void> {
     console.log(
       `[MCPGlobalClient] Connecting to ${serverId}: ${config.command} ${config.args.join(' ')}`
     );
 
-    const client = new MCPClient();
+    // Workflow code records its own timeline events via recordEvent(),
+    // so the per-server client does not log to the browser store.
+    const client = new MCPClient(null);
+    client.setToolListChangedHandler(() => {
+      console.log(`[MCPGlobalClient] Tool list changed on ${serverId}`);
+      this.invalidateToolList();
+      // Cached results may come from tools that changed or were removed
+      this.toolResultCache.clear();
+    });
     await client.connect(config);
 
     this.clients.set(serverId, client);
     this.serverConfigs.set(serverId, config);
+    this.invalidateToolList();
+    config.pureTools?.forEach((toolName) => this.markToolPure(toolName));
 
     console.log(`[MCPGlobalClient] Connected to ${serverId}`);
   }
@@ -267,47 +318,166 @@ export class MCPGlobalClient {
     console.log(`[MCPGlobalClient] Connected to ${connectedCount}/${configs.length} servers`);
   }
 
+  /**
+   * Drop the cached tool list.
+   *
+   * Bumping the generation also stops a listing that is already in flight
+   * from caching its now-outdated result.
+   */
+  private invalidateToolList(): void {
+    this.toolListCache = null;
+    this.toolListGeneration++;
+  }
+
+  /**
+   * Check whether tools have already been discovered for the current connections.
+   */
+  public hasCachedToolList(): boolean {
+    return this.toolListCache !== null;
+  }
+
   /**
    * List available tools from all connected servers.
    *
-   * Tools are aggregated from all servers and tagged with their source server.
+   * Servers are queried concurrently; tools are aggregated in server
+   * registration order and tagged with their source server.
+   * The result is cached until the set of connected servers changes or a
+   * server reports that its tool list changed.
    */
   public async listTools(): Promise<MCPTool[]> {
+    if (this.toolListCache) {
+      return [...this.toolListCache];
+    }
+
+    const generation = this.toolListGeneration;
+    const serverTools = await Promise.all(
+      Array.from(this.clients.entries()).map(async ([serverId, client]) => {
+        try {
+          return { serverId, tools: await client.listTools() };
+        } catch (error) {
+          console.error(
+            `[MCPGlobalClient] Failed to list tools from ${serverId}:`,
+            error
+          );
+          // Continue with other servers even if one fails
+          return { serverId, tools: null };
+        }
+      })
+    );
+
     const allTools: MCPTool[] = [];
+    const toolToServerMap = new Map<string, string>();
 
-    for (const [serverId, client] of this.clients.entries()) {
-      try {
-        const tools = await client.listTools();
-        const serverName = this.serverConfigs.get(serverId)?.name || serverId;
-
-        // Tag each tool with its server and add to mapping
-        for (const tool of tools) {
-          const taggedTool: MCPTool = {
-            ...tool,
-            serverId,
-            serverName,
-          };
-          allTools.push(taggedTool);
-
-          // Build tool-to-server mapping for routing
-          this.toolToServerMap.set(tool.name, serverId);
+    for (const { serverId, tools } of serverTools) {
+      if (!tools) continue;
+
+      const serverName = this.serverConfigs.get(serverId)?.name || serverId;
+
+      // Tag each tool with its server and add to mapping
+      for (const tool of tools) {
+        const taggedTool: MCPTool = {
+          ...tool,
+          serverId,
+          serverName,
+        };
+        allTools.push(taggedTool);
+
+        // Build tool-to-server mapping for routing (first server wins on name clashes)
+        if (!toolToServerMap.has(tool.name)) {
+          toolToServerMap.set(tool.name, serverId);
         }
-      } catch (error) {
-        console.error(
-          `[MCPGlobalClient] Failed to list tools from ${serverId}:`,
-          error
-        );
-        // Continue with other servers even if one fails
       }
     }
 
-    return allTools;
+    // Replace the routing table so tools a server no longer exposes stop routing to it
+    this.toolToServerMap = toolToServerMap;
+
+    // Only cache a complete listing so failed servers are retried next time,
+    // and only if nothing invalidated the list while it was being fetched
+    if (
+      generation === this.toolListGeneration &&
+      serverTools.every(({ tools }) => tools !== null)
+    ) {
+      this.toolListCache = allTools;
+    }
+
+    return [...allTools];
+  }
+
+  /**
+   * Mark a tool as side-effect free so its results may be cached.
+   */
+  public markToolPure(toolName: string): void {
+    this.pureTools.add(toolName);
+  }
+
+  /**
+   * Build the cache key for a tool call.
+   */
+  private toolResultCacheKey(toolName: string, args: Record<string, unknown>): string {
+    return `${toolName}\u0000${canonicalJSON(args)}`;
+  }
+
+  /**
+   * Get a cached result for a pure tool call, if one exists and has not expired.
+   *
+   * Callers check this before callTool(), which does not consult the cache.
+   */
+  public getCachedToolResult(
+    toolName: string,
+    args: Record<string, unknown>
+  ): MCPToolResult | undefined {
+    if (!this.pureTools.has(toolName)) {
+      return undefined;
+    }
+
+    const key = this.toolResultCacheKey(toolName, args);
+    const cached = this.toolResultCache.get(key);
+
+    if (!cached) {
+      return undefined;
+    }
+
+    this.toolResultCache.delete(key);
+
+    if (Date.now() - cached.cachedAt > this.toolResultTtlMs) {
+      return undefined;
+    }
+
+    // Refresh recency (Map preserves insertion order)
+    this.toolResultCache.set(key, cached);
+
+    return cached.result;
+  }
+
+  /**
+   * Store a successful pure tool result (LRU, maintains max size).
+   */
+  private cacheToolResult(
+    toolName: string,
+    args: Record<string, unknown>,
+    result: MCPToolResult
+  ): void {
+    if (!this.pureTools.has(toolName) || result.isError) {
+      return;
+    }
+
+    this.toolResultCache.set(this.toolResultCacheKey(toolName, args), {
+      result,
+      cachedAt: Date.now(),
+    });
+
+    if (this.toolResultCache.size > this.maxToolResultCacheSize) {
+      this.toolResultCache.delete(this.toolResultCache.keys().next().value as string);
+    }
   }
 
   /**
    * Call a tool on the appropriate connected server.
    *
    * Uses the tool-to-server mapping to route the call to the correct server.
+   * Always performs the call; successful results of pure tools are stored
+   * for getCachedToolResult().
    */
   public async callTool(
     toolName: string,
@@ -330,7 +500,10 @@ export class MCPGlobalClient {
       );
     }
 
-    return await client.callTool(toolName, args);
+    const result = await client.callTool(toolName, args);
+    this.cacheToolResult(toolName, args, result);
+
+    return result;
   }
 
   /**
@@ -373,6 +546,9 @@ export class MCPGlobalClient {
     this.clients.clear();
     this.serverConfigs.clear();
     this.toolToServerMap.clear();
+    this.pureTools.clear();
+    this.toolResultCache.clear();
+    this.invalidateToolList();
 
     // Clear session state if requested (for fresh start)
     if (clearSession) {
@@ -415,6 +591,7 @@ export class MCPGlobalClient {
     connected: boolean;
     connectedServers: string[];
     totalTools: number;
+    cachedToolResults: number;
   } {
     return {
       sessionId: this.currentSessionId,
@@ -424,6 +601,7 @@ export class MCPGlobalClient {
       connected: this.isConnected(),
       connectedServers: Array.from(this.clients.keys()),
       totalTools: this.toolToServerMap.size,
+      cachedToolResults: this.toolResultCache.size,
     };
   }
 }
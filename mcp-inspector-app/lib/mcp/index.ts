@@ -4,7 +4,7 @@
  * Central export point for all MCP-related functionality.
  */
 
-export { MCPClient, mcpClient } from './client';
+export { MCPClient, mcpClient, type MCPLogger } from './client';
 export { ConnectionManager, connectionManager } from './connection';
 export {
   recordProtocolMessage,
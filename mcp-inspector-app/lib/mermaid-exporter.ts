@@ -12,31 +12,39 @@ interface PhaseGroup {
   events: TimelineEvent[];
 }
 
+/**
+ * Internal actor names → Mermaid participant names
+ */
+const ACTOR_MAP: Readonly<Record<string, string>> = Object.freeze({
+  host_app: 'HostApp',
+  llm: 'LLM',
+  mcp_server: 'MCPServer',
+  external_api: 'ExternalAPI',
+});
+
+/**
+ * Phase names → display-friendly labels
+ */
+const PHASE_MAP: Readonly<Record<string, string>> = Object.freeze({
+  initialization: 'Initialization & Negotiation',
+  discovery: 'Discovery & Contextualization',
+  selection: 'Model-Driven Selection',
+  execution: 'Execution Round Trip',
+  synthesis: 'Synthesis & Final Response',
+});
+
 /**
  * Maps internal actor names to Mermaid participant names
  */
 function mapActor(actor: string): string {
-  const actorMap: Record<string, string> = {
-    host_app: 'HostApp',
-    llm: 'LLM',
-    mcp_server: 'MCPServer',
-    external_api: 'ExternalAPI',
-  };
-  return actorMap[actor] || actor;
+  return ACTOR_MAP[actor] || actor;
 }
 
 /**
  * Maps phase names to display-friendly labels
  */
 function mapPhase(phase: string): string {
-  const phaseMap: Record<string, string> = {
-    initialization: 'Initialization & Negotiation',
-    discovery: 'Discovery & Contextualization',
-    selection: 'Model-Driven Selection',
-    execution: 'Execution Round Trip',
-    synthesis: 'Synthesis & Final Response',
-  };
-  return phaseMap[phase] || phase;
+  return PHASE_MAP[phase] || phase;
 }
 
 /**
@@ -12,11 +12,9 @@
  */
 
 import { getMCPClient } from '../mcp/global-client';
-import { createClaudeClient } from '../llm/claude-client';
+import { getClaudeClient } from '../llm/claude-client';
 import {
   convertMCPToolsToClaudeFormat,
-  extractToolCalls,
-  extractTextResponse,
   formatToolResultForClaude,
   type ClaudeToolUse,
   type ClaudeToolResult
@@ -79,8 +77,8 @@ export async function executeWorkflow(
     // Get global MCP client (singleton)
     const mcpClient = getMCPClient();
 
-    // Create Claude client
-    const claudeClient = createClaudeClient(apiKey);
+    // Get shared Claude client (reuses its HTTP connections across queries)
+    const claudeClient = getClaudeClient(apiKey);
 
     // ===================================================================
     // PHASE 1: INITIALIZATION & NEGOTIATION
@@ -173,89 +171,109 @@ export async function executeWorkflow(
     // ===================================================================
     const phase2Start = Date.now();
 
-    mcpClient.recordEvent({
-      eventType: 'console_log',
-      actor: 'host_app',
-      logLevel: 'info',
-      logMessage: 'Discovering available tools...',
-      badgeType: 'INTERNAL',
-      metadata: {
-        phase: 'discovery',
-        messageType: 'discovery_start'
-      }
-    });
+    // Discover tools (tools/list) unless this connection has already done so
+    let mcpTools: MCPTool[];
 
-    // Record tools/list request (protocol message in Host ↔ MCP lane)
-    const toolsListRequestTime = Date.now();
-    mcpClient.recordEvent({
-      eventType: 'protocol_message',
-      actor: 'host_app',
-      direction: 'sent',
-      lane: 'host_mcp',
-      message: {
-        jsonrpc: '2.0',
-        id: 2,
-        method: 'tools/list'
-      },
-      metadata: {
-        phase: 'discovery',
-        messageType: 'tools_list_request'
-      }
-    });
+    if (!mcpClient.hasCachedToolList()) {
+      mcpClient.recordEvent({
+        eventType: 'console_log',
+        actor: 'host_app',
+        logLevel: 'info',
+        logMessage: 'Discovering available tools...',
+        badgeType: 'INTERNAL',
+        metadata: {
+          phase: 'discovery',
+          messageType: 'discovery_start'
+        }
+      });
 
-    // Server-side log: processing tools/list
-    mcpClient.recordEvent({
-      eventType: 'console_log',
-      actor: 'mcp_server',
-      logLevel: 'info',
-      logMessage: 'Listing available tools...',
-      badgeType: 'SERVER',
-      metadata: {
-        phase: 'discovery',
-        messageType: 'server_processing'
-      }
-    });
+      // Record tools/list request (protocol message in Host ↔ MCP lane)
+      const toolsListRequestTime = Date.now();
+      mcpClient.recordEvent({
+        eventType: 'protocol_message',
+        actor: 'host_app',
+        direction: 'sent',
+        lane: 'host_mcp',
+        message: {
+          jsonrpc: '2.0',
+          id: 2,
+          method: 'tools/list'
+        },
+        metadata: {
+          phase: 'discovery',
+          messageType: 'tools_list_request'
+        }
+      });
+
+      // Server-side log: processing tools/list
+      mcpClient.recordEvent({
+        eventType: 'console_log',
+        actor: 'mcp_server',
+        logLevel: 'info',
+        logMessage: 'Listing available tools...',
+        badgeType: 'SERVER',
+        metadata: {
+          phase: 'discovery',
+          messageType: 'server_processing'
+        }
+      });
 
-    // Discover tools from MCP server
-    const mcpTools: MCPTool[] = await mcpClient.listTools();
-    const toolsListProcessingTime = Date.now() - toolsListRequestTime;
+      // Discover tools from MCP server
+      mcpTools = await mcpClient.listTools();
+      const toolsListProcessingTime = Date.now() - toolsListRequestTime;
 
-    // Record tools/list response (protocol message in Host ↔ MCP lane)
-    mcpClient.recordEvent({
-      eventType: 'protocol_message',
-      actor: 'mcp_server',
-      direction: 'received',
-      lane: 'host_mcp',
-      message: {
-        jsonrpc: '2.0',
-        id: 2,
-        result: {
-          tools: mcpTools.map(tool => ({
-            name: tool.name,
-            description: tool.description,
-            inputSchema: tool.inputSchema
-          }))
+      // Record tools/list response (protocol message in Host ↔ MCP lane)
+      mcpClient.recordEvent({
+        eventType: 'protocol_message',
+        actor: 'mcp_server',
+        direction: 'received',
+        lane: 'host_mcp',
+        message: {
+          jsonrpc: '2.0',
+          id: 2,
+          result: {
+            tools: mcpTools.map(tool => ({
+              name: tool.name,
+              description: tool.description,
+              inputSchema: tool.inputSchema
+            }))
+          }
+        },
+        metadata: {
+          phase: 'discovery',
+          messageType: 'tools_list_response',
+          processingTime: toolsListProcessingTime
         }
-      },
-      metadata: {
-        phase: 'discovery',
-        messageType: 'tools_list_response',
-        processingTime: toolsListProcessingTime
-      }
-    });
+      });
 
-    mcpClient.recordEvent({
-      eventType: 'console_log',
-      actor: 'host_app',
-      logLevel: 'info',
-      logMessage: `Discovered ${mcpTools.length} tool(s)`,
-      badgeType: 'INTERNAL',
-      metadata: {
-        phase: 'discovery',
-        messageType: 'discovery_complete',
-        toolCount: mcpTools.length
-      }
-    });
+      mcpClient.recordEvent({
+        eventType: 'console_log',
+        actor: 'host_app',
+        logLevel: 'info',
+        logMessage: `Discovered ${mcpTools.length} tool(s)`,
+        badgeType: 'INTERNAL',
+        metadata: {
+          phase: 'discovery',
+          messageType: 'discovery_complete',
+          toolCount: mcpTools.length
+        }
+      });
+    } else {
+      mcpTools = await mcpClient.listTools();
+
+      mcpClient.recordEvent({
+        eventType: 'console_log',
+        actor: 'host_app',
+        logLevel: 'info',
+        logMessage: `Using previously discovered tools (${mcpTools.length})`,
+        badgeType: 'INTERNAL',
+        metadata: {
+          phase: 'discovery',
+          messageType: 'discovery_reuse',
+          toolCount: mcpTools.length
+        }
+      });
+    }
 
     // Convert MCP tools to Claude format
     mcpClient.recordEvent({
@@ -303,7 +321,7 @@ export async function executeWorkflow(
 
     // If no tools selected, return direct response
     if (toolCalls.length === 0) {
-      const textResponse = extractTextResponse(planningResult.message.content);
+      const textResponse = planningResult.textResponse;
 
       mcpClient.recordEvent({
         eventType: 'console_log',
@@ -346,35 +364,51 @@ export async function executeWorkflow(
 
     let currentToolCalls = toolCalls;
     let loopIteration = 0;
+    let nextToolCallId = 3; // JSON-RPC ids after initialize (1) and tools/list (2)
     const MAX_ITERATIONS = 5; // Safety limit
     const allToolsUsed: string[] = []; // Track all tools across iterations
+    let finalResponse = ''; // Text from the most recent synthesis response
 
     while (currentToolCalls.length > 0 && loopIteration < MAX_ITERATIONS) {
       loopIteration++;
 
       // PHASE 4: EXECUTION ROUND TRIP
       const phase4Start = Date.now();
-      const toolResults: ClaudeToolResult[] = [];
-
-      for (const toolCall of currentToolCalls) {
-        // Track tool usage
-        allToolsUsed.push(toolCall.name);
-
-        // Execute tool (records its own events)
-        const mcpResult = await executeSingleTool(
-          mcpClient,
-          toolCall.name,
-          toolCall.input as Record<string, unknown>
-        );
-
-        // Format result for Claude
-        const claudeResult = formatToolResultForClaude(
-          toolCall.id,
-          mcpResult
-        );
-
-        toolResults.push(claudeResult);
-      }
+
+      // Track tool usage
+      allToolsUsed.push(...currentToolCalls.map(tc => tc.name));
+
+      // Execute independent tool calls concurrently (each records its own events,
+      // including an error response if the call fails). Wall-clock time becomes
+      // the slowest call rather than the sum of all calls. Each call gets its own
+      // JSON-RPC id so interleaved request/response cards stay matched.
+      const settledResults = await Promise.allSettled(
+        currentToolCalls.map(toolCall =>
+          executeSingleTool(
+            mcpClient,
+            toolCall.name,
+            toolCall.input as Record<string, unknown>,
+            nextToolCallId++
+          )
+        )
+      );
+
+      // Format results for Claude, preserving tool_use order.
+      // A failed call becomes an error tool_result so the LLM can react to it.
+      const toolResults: ClaudeToolResult[] = settledResults.map((settled, i) => {
+        if (settled.status === 'fulfilled') {
+          return formatToolResultForClaude(currentToolCalls[i].id, settled.value);
+        }
+
+        const errorMessage = settled.reason instanceof Error
+          ? settled.reason.message
+          : String(settled.reason);
+
+        return formatToolResultForClaude(currentToolCalls[i].id, {
+          content: [{ type: 'text', text: `Tool call failed: ${errorMessage}` }],
+          isError: true
+        });
+      });
 
       phaseTimings.execution += Date.now() - phase4Start;
 
@@ -405,8 +439,9 @@ export async function executeWorkflow(
         content: synthesisResult.message.content
       });
 
-      // Check if LLM wants to call more tools
-      currentToolCalls = extractToolCalls(synthesisResult.message.content);
+      // Check if LLM wants to call more tools (already extracted by ClaudeClient)
+      finalResponse = synthesisResult.textResponse;
+      currentToolCalls = synthesisResult.toolCalls;
 
       if (currentToolCalls.length > 0) {
         // LLM wants to call more tools - log this and continue loop
@@ -440,10 +475,6 @@ export async function executeWorkflow(
       });
     }
 
-    // Extract final text response from last assistant message
-    const lastAssistantMessage = conversationHistory[conversationHistory.length - 1];
-    const finalResponse = extractTextResponse(lastAssistantMessage.content);
-
     // Record: Workflow complete
     const totalTime = Date.now() - startTime;
     mcpClient.recordEvent({
@@ -28,6 +28,12 @@ import type {
 } from '../types/domain';
 import { COLUMN_DEFINITIONS } from '../components/column-definitions';
 
+/**
+ * Message type suffix stripped when deriving a method name,
+ * e.g. "tools_list_request" → "tools_list"
+ */
+const MESSAGE_TYPE_SUFFIX = /_(?:request|response|notification)$/;
+
 /**
  * Build rows from timeline events with automatic spacer insertion
  *
@@ -294,11 +300,7 @@ function extractMethodFromMetadata(event: ProtocolMessageEvent): string {
   if (messageType) {
     // Convert "initialize_response" → "initialize"
     // Convert "tools_list_request" → "tools/list"
-    return messageType
-      .replace(/_request$/, '')
-      .replace(/_response$/, '')
-      .replace(/_notification$/, '')
-      .replace(/_/g, '/');
+    return messageType.replace(MESSAGE_TYPE_SUFFIX, '').replace(/_/g, '/');
   }
 
   // Fallback to checking the message itself
@@ -20,6 +20,7 @@ export interface MCPServerRecord {
       name: string;
       description: string;
     }>;
+    pureTools?: string[];
   };
 }
 
@@ -40,6 +41,7 @@ export function toMCPServerConfig(record: MCPServerRecord): MCPServerConfig {
     command: record.command,
     args: record.args,
     env: record.env,
+    pureTools: record.metadata?.pureTools,
   };
 }
 
@@ -49,6 +51,7 @@ export function toMCPServerConfig(record: MCPServerRecord): MCPServerConfig {
 class MCPServerStorage {
   private filePath: string;
   private cache: MCPServersData | null = null;
+  private cacheMtimeMs: number | null = null; // mtime of the file the cache was parsed from
 
   constructor() {
     // Store in data directory relative to project root
@@ -57,13 +60,23 @@ class MCPServerStorage {
 
   /**
    * Read all servers from storage
+   *
+   * The parsed file is cached and only re-read when its mtime changes,
+   * so repeated lookups (every workflow run, every connect) skip the
+   * read and JSON parse. Returns a fresh array that callers may modify.
    */
   async readAll(): Promise<MCPServerRecord[]> {
     try {
+      const { mtimeMs } = await fs.stat(this.filePath);
+      if (this.cache && this.cacheMtimeMs === mtimeMs) {
+        return [...this.cache.servers];
+      }
+
       const data = await fs.readFile(this.filePath, 'utf-8');
       const parsed: MCPServersData = JSON.parse(data);
       this.cache = parsed;
-      return parsed.servers;
+      this.cacheMtimeMs = mtimeMs;
+      return [...parsed.servers];
     } catch (error) {
       // If file doesn't exist, return empty array
       if ((error as NodeJS.ErrnoException).code === 'ENOENT') {
@@ -156,6 +169,7 @@ class MCPServerStorage {
     const data: MCPServersData = { servers };
     await fs.writeFile(this.filePath, JSON.stringify(data, null, 2), 'utf-8');
     this.cache = data;
+    this.cacheMtimeMs = (await fs.stat(this.filePath)).mtimeMs;
   }
 
   /**
@@ -163,6 +177,7 @@ class MCPServerStorage {
    */
   clearCache(): void {
     this.cache = null;
+    this.cacheMtimeMs = null;
   }
 }
 
@@ -67,6 +67,7 @@ export interface MCPServerConfig {
   command: string;
   args: string[];
   env?: Record<string, string>;
+  pureTools?: string[]; // Side-effect-free tools whose results may be cached
 }
 
 // ============================================================================